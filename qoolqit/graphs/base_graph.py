@@ -5,12 +5,15 @@ from typing import Any
 
 import matplotlib.pyplot as plt
 import networkx as nx
+import numpy as np
 from matplotlib.axes import Axes
+from scipy.spatial import cKDTree
 
 from .utils import (
+    ATOL_32,
     all_node_pairs,
     distances,
-    less_or_equal,
+    pairwise_distances,
     scale_coords,
     space_coords,
 )
@@ -159,10 +162,7 @@ class BaseGraph(nx.Graph):
     @property
     def sorted_edges(self) -> set:
         """Returns the set of edges (u, v) such that (u < v)."""
-        nx_edges = set(self.edges)
-        unordered_edges = set(filter(lambda x: x[0] > x[1], nx_edges))
-        corrected_edges = set((j, i) for (i, j) in unordered_edges)
-        return (nx_edges - unordered_edges).union(corrected_edges)
+        return {(u, v) if u <= v else (v, u) for u, v in self.edges}
 
     @property
     def all_node_pairs(self) -> set:
@@ -222,6 +222,44 @@ class BaseGraph(nx.Graph):
             coords_dict = coords
         self._coords = coords_dict
 
+    def _node_labels(self) -> np.ndarray:
+        """Return the node labels in `list(graph.nodes)` order as a 1-D object array.
+
+        An object array keeps tuple labels, e.g. lattice (i, j) labels, as single entries.
+        """
+        labels = np.empty(self.number_of_nodes(), dtype=object)
+        labels[:] = list(self.nodes)
+        return labels
+
+    @property
+    def coords_array(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the node labels and the node coordinates as arrays.
+
+        Row i of the coordinates array of shape (n_nodes, 2) holds the coordinates
+        of the node at position i of the node labels array.
+        """
+        if not self.has_coords:
+            raise AttributeError("Trying to get the coordinates of a graph without coordinates.")
+        nodes = self._node_labels()
+        coords = np.array([self._coords[n] for n in nodes], dtype=float)
+        return nodes, coords
+
+    @property
+    def edges_array(self) -> np.ndarray:
+        """Return the edges as an array of node positions of shape (n_edges, 2).
+
+        Each row (i, j) with (i < j) holds the positions of the edge nodes in the
+        node labels array returned by `coords_array`, i.e. in `list(graph.nodes)`.
+        """
+        node_index = {n: i for i, n in enumerate(self.nodes)}
+        edges = [sorted((node_index[u], node_index[v])) for u, v in self.edges]
+        return np.array(sorted(edges), dtype=int).reshape(-1, 2)
+
+    @property
+    def edge_nodes(self) -> np.ndarray:
+        """Return the edges as an array of node labels of shape (n_edges, 2)."""
+        return self._node_labels()[self.edges_array]
+
     # methods
 
     def distances(self, edge_list: Iterable | None = None) -> dict:
@@ -235,31 +273,90 @@ class BaseGraph(nx.Graph):
         """
         if self.has_coords:
             if edge_list is None:
-                edge_list = self.all_node_pairs
+                return self._all_pairs_distances()
             elif len(edge_list) == 0:  # type: ignore [arg-type]
                 raise ValueError("Trying to compute distances for an empty edge list.")
             return distances(self.coords, edge_list)
         else:
             raise AttributeError("Trying to compute distances for a graph without coordinates.")
 
+    def _all_pairs_distances(self) -> dict:
+        """Returns the distances between all node pairs (u, v) such that (u < v).
+
+        All distances are computed in a single vectorized call instead of one
+        Python call per node pair.
+        """
+        nodes, coords = self.coords_array
+        dists = pairwise_distances(coords).tolist()
+        iu, ju = np.triu_indices(len(nodes), k=1)
+        pairs = [(u, v) if u <= v else (v, u) for u, v in zip(nodes[iu], nodes[ju])]
+        return dict(zip(pairs, dists))
+
+    def edge_distances(self, edge_list: Iterable | None = None) -> np.ndarray:
+        """Returns an array of distances for a given set of edges.
+
+        Distances are calculated directly from the coordinates. Raises an error
+        if there are no coordinates on the graph.
+
+        Arguments:
+            edge_list: set of edges. If None, uses the graph edges in the same
+                order as `edge_nodes`.
+        """
+        if not self.has_coords:
+            raise AttributeError("Trying to compute distances for a graph without coordinates.")
+        _, coords = self.coords_array
+        if edge_list is None:
+            edges = self.edges_array
+        else:
+            node_index = {n: i for i, n in enumerate(self.nodes)}
+            edges = np.array(
+                [(node_index[u], node_index[v]) for u, v in edge_list], dtype=int
+            ).reshape(-1, 2)
+        diff = coords[edges[:, 0]] - coords[edges[:, 1]]
+        dists: np.ndarray = np.linalg.norm(diff, axis=1)
+        return dists
+
     def interactions(self) -> dict:
         """Rydberg model interaction 1/r^6 between pair of nodes."""
         return {p: 1.0 / (r**6) for p, r in self.distances().items()}
 
+    def _edge_mask(self) -> np.ndarray:
+        """Returns a boolean mask of the graph edges over the condensed distance array.
+
+        The mask follows the node order of `coords_array` and the pair order of
+        `pairwise_distances`. Self-loops are ignored.
+        """
+        n_nodes = self.number_of_nodes()
+        edges = self.edges_array
+        i, j = edges[edges[:, 0] != edges[:, 1]].T
+        mask = np.zeros(n_nodes * (n_nodes - 1) // 2, dtype=bool)
+        mask[n_nodes * i - i * (i + 1) // 2 + j - i - 1] = True
+        return mask
+
+    def _distances_array(self, connected: bool | None = None) -> np.ndarray:
+        """Returns an array of node pair distances.
+
+        Arguments:
+            connected: if True/False, computes only over connected/disconnected nodes.
+        """
+        if connected:
+            dists = self.edge_distances()
+        else:
+            _, coords = self.coords_array
+            dists = pairwise_distances(coords)
+            if connected is not None:
+                dists = dists[~self._edge_mask()]
+        if dists.size == 0:
+            raise ValueError("Trying to compute distances for an empty edge list.")
+        return dists
+
     def min_distance(self, connected: bool | None = None) -> float:
         """Returns the minimum distance in the graph.
 
         Arguments:
             connected: if True/False, computes only over connected/disconnected nodes.
         """
-        distance: float
-        if connected is None:
-            distance = min(self.distances(self.all_node_pairs).values())
-        elif connected:
-            distance = min(self.distances(self.sorted_edges).values())
-        else:
-            distance = min(self.distances(self.all_node_pairs - self.sorted_edges).values())
-        return distance
+        return float(self._distances_array(connected).min())
 
     def max_distance(self, connected: bool | None = None) -> float:
         """Returns the maximum distance in the graph.
@@ -267,14 +364,7 @@ class BaseGraph(nx.Graph):
         Arguments:
             connected: if True/False, computes only over connected/disconnected nodes.
         """
-        distance: float
-        if connected is None:
-            distance = max(self.distances(self.all_node_pairs).values())
-        elif connected:
-            distance = max(self.distances(self.sorted_edges).values())
-        else:
-            distance = max(self.distances(self.all_node_pairs - self.sorted_edges).values())
-        return distance
+        return float(self._distances_array(connected).max())
 
     def ud_radius_range(self) -> tuple:
         """Return the range (R_min, R_max) where the graph is unit-disk.
@@ -286,15 +376,22 @@ class BaseGraph(nx.Graph):
         graph.ud_edges(radius = R) == graph.sorted edges
         """
         if self.has_coords:
-            n_edges = len(self.sorted_edges)
-            if n_edges == 0:
+            _, coords = self.coords_array
+            dists = pairwise_distances(coords)
+            if dists.size == 0:
+                raise ValueError("Trying to compute distances for an empty edge list.")
+            edge_mask = self._edge_mask()
+
+            if not edge_mask.any():
                 # If the graph is empty and has coordinates
-                return (0.0, self.min_distance(connected=False))
-            elif n_edges == len(self.all_node_pairs):
+                return (0.0, float(dists.min()))
+            max_in = float(dists[edge_mask].max())
+            if edge_mask.all():
                 # If the graph is fully connected
-                return (self.max_distance(connected=True), float("inf"))
-            elif self.max_distance(connected=True) < self.min_distance(connected=False):
-                return (self.max_distance(connected=True), self.min_distance(connected=False))
+                return (max_in, float("inf"))
+            min_out = float(dists[~edge_mask].min())
+            if max_in < min_out:
+                return (max_in, min_out)
             else:
                 raise ValueError("Graph is not unit disk.")
         else:
@@ -315,7 +412,12 @@ class BaseGraph(nx.Graph):
             radius: the value
         """
         if self.has_coords:
-            return set(e for e, d in self.distances().items() if less_or_equal(d, radius))
+            nodes, coords = self.coords_array
+            # Pad the radius with the same absolute tolerance used in `less_or_equal`
+            pairs = cKDTree(coords).query_pairs(radius + ATOL_32, output_type="ndarray")
+            return {
+                (u, v) if u <= v else (v, u) for u, v in zip(nodes[pairs[:, 0]], nodes[pairs[:, 1]])
+            }
         else:
             raise AttributeError("Getting unit disk edges is not valid without coordinates.")
 
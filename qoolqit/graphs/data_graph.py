@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 import networkx as nx
@@ -19,6 +20,78 @@ if TYPE_CHECKING:
     import torch_geometric
 
 
+# Unit-spacing lattice templates, cached on the integer lattice size. The returned
+# tuples are immutable, so every graph built from them gets its own coordinates and
+# edges and the cache never needs to be invalidated.
+LatticeTemplate = tuple[tuple[tuple[float, float], ...], tuple[tuple[int, int], ...]]
+
+
+def _template_from_nx(G: nx.Graph) -> LatticeTemplate:
+    """Return the unit coordinates and edges of a networkx lattice with positions."""
+    G = nx.convert_node_labels_to_integers(G)
+    pos_unit = nx.get_node_attributes(G, "pos")
+    coords = tuple((float(x), float(y)) for x, y in (pos_unit[i] for i in range(len(G))))
+    return coords, tuple(G.edges)
+
+
+@lru_cache(maxsize=256)
+def _triangular_template(m: int, n: int) -> LatticeTemplate:
+    return _template_from_nx(nx.triangular_lattice_graph(m, n, with_positions=True))
+
+
+@lru_cache(maxsize=256)
+def _hexagonal_template(m: int, n: int) -> LatticeTemplate:
+    return _template_from_nx(nx.hexagonal_lattice_graph(m, n, with_positions=True))
+
+
+@lru_cache(maxsize=256)
+def _square_template(m: int, n: int) -> LatticeTemplate:
+    G = nx.grid_2d_graph(m, n)
+    coords = tuple((float(x), float(y)) for (x, y) in G.nodes)
+    G = nx.convert_node_labels_to_integers(G)
+    return coords, tuple(G.edges)
+
+
+@lru_cache(maxsize=256)
+def _heavy_hexagonal_template(m: int, n: int) -> LatticeTemplate:
+    G_hex = nx.hexagonal_lattice_graph(m, n, with_positions=True)
+    pos_unit = nx.get_node_attributes(G_hex, "pos")
+
+    G_heavy = nx.Graph()
+
+    label_map = {}
+    for old_label, (x, y) in pos_unit.items():
+        # Relabel to an even-integer grid to make space for midpoint nodes
+        new_label = (2 * old_label[0], 2 * old_label[1])
+        label_map[old_label] = new_label
+
+        # Double the positions so that the midpoint nodes are at unit spacing
+        G_heavy.add_node(new_label, pos=(2.0 * x, 2.0 * y))
+
+    for u_old, v_old in G_hex.edges():
+        u_new, v_new = label_map[u_old], label_map[v_old]
+
+        mid_label = ((u_new[0] + v_new[0]) // 2, (u_new[1] + v_new[1]) // 2)
+
+        pos_u = G_heavy.nodes[u_new]["pos"]
+        pos_v = G_heavy.nodes[v_new]["pos"]
+        mid_pos = ((pos_u[0] + pos_v[0]) / 2, (pos_u[1] + pos_v[1]) / 2)
+
+        G_heavy.add_node(mid_label, pos=mid_pos)
+        G_heavy.add_edge(u_new, mid_label)
+        G_heavy.add_edge(mid_label, v_new)
+
+    final_nodes = sorted(list(G_heavy.nodes()))
+
+    final_coords = tuple(G_heavy.nodes[label]["pos"] for label in final_nodes)
+
+    label_to_int = {label: i for i, label in enumerate(final_nodes)}
+
+    final_edges = tuple((label_to_int[u], label_to_int[v]) for u, v in G_heavy.edges())
+
+    return final_coords, final_edges
+
+
 class DataGraph(BaseGraph):
     """The main graph structure to represent problem data."""
 
@@ -31,6 +104,20 @@ class DataGraph(BaseGraph):
         """
         super().__init__(edges)
 
+    @classmethod
+    def _from_template(cls, template: LatticeTemplate, spacing: float) -> DataGraph:
+        """Constructs a graph from a unit-spacing lattice template.
+
+        Arguments:
+            template: pair of unit coordinates and edges of the lattice.
+            spacing: The distance between adjacent nodes on the final lattice.
+        """
+        coords_unit, edges = template
+        graph = cls.from_coordinates([(x * spacing, y * spacing) for x, y in coords_unit])
+        graph.add_edges_from(edges)
+        graph._reset_dicts()
+        return graph
+
     @classmethod
     def line(cls, n: int, spacing: float = 1.0) -> DataGraph:
         """Constructs a line graph, with the respective coordinates.
@@ -103,16 +190,7 @@ class DataGraph(BaseGraph):
             n: Number of columns of triangles.
             spacing: The distance between adjacent nodes on the final lattice.
         """
-        G = nx.triangular_lattice_graph(m, n, with_positions=True)
-        G = nx.convert_node_labels_to_integers(G)
-        pos_unit = nx.get_node_attributes(G, "pos")
-
-        final_pos = {node: (x * spacing, y * spacing) for node, (x, y) in pos_unit.items()}
-
-        graph = cls.from_coordinates(final_pos)
-        graph.add_edges_from(G.edges)
-        graph._reset_dicts()
-        return graph
+        return cls._from_template(_triangular_template(m, n), spacing)
 
     @classmethod
     def hexagonal(
@@ -129,16 +207,7 @@ class DataGraph(BaseGraph):
             n: Number of columns of hexagons.
             spacing: The distance between adjacent nodes on the final lattice.
         """
-        G = nx.hexagonal_lattice_graph(m, n, with_positions=True)
-        G = nx.convert_node_labels_to_integers(G)
-        pos_unit = nx.get_node_attributes(G, "pos")
-
-        final_pos = {node: (x * spacing, y * spacing) for node, (x, y) in pos_unit.items()}
-
-        graph = cls.from_coordinates(final_pos)
-        graph.add_edges_from(G.edges)
-        graph._reset_dicts()
-        return graph
+        return cls._from_template(_hexagonal_template(m, n), spacing)
 
     @classmethod
     def heavy_hexagonal(
@@ -159,47 +228,7 @@ class DataGraph(BaseGraph):
             The heavy-hexagonal lattice is a regular hexagonal lattice where
             each edge is decorated with an additional lattice site.
         """
-        G_hex = nx.hexagonal_lattice_graph(m, n, with_positions=True)
-        pos_unit = nx.get_node_attributes(G_hex, "pos")
-
-        G_heavy = nx.Graph()
-        scaling_factor = 2 * spacing
-
-        label_map = {}
-        for old_label, (x, y) in pos_unit.items():
-            # Relabel to an even-integer grid to make space for midpoint nodes
-            new_label = (2 * old_label[0], 2 * old_label[1])
-            label_map[old_label] = new_label
-
-            # Scale positions and add the node to the new graph
-            new_pos = (x * scaling_factor, y * scaling_factor)
-            G_heavy.add_node(new_label, pos=new_pos)
-
-        for u_old, v_old in G_hex.edges():
-            u_new, v_new = label_map[u_old], label_map[v_old]
-
-            mid_label = ((u_new[0] + v_new[0]) // 2, (u_new[1] + v_new[1]) // 2)
-
-            pos_u = G_heavy.nodes[u_new]["pos"]
-            pos_v = G_heavy.nodes[v_new]["pos"]
-            mid_pos = ((pos_u[0] + pos_v[0]) / 2, (pos_u[1] + pos_v[1]) / 2)
-
-            G_heavy.add_node(mid_label, pos=mid_pos)
-            G_heavy.add_edge(u_new, mid_label)
-            G_heavy.add_edge(mid_label, v_new)
-
-        final_nodes = sorted(list(G_heavy.nodes()))
-
-        final_coords = [G_heavy.nodes[label]["pos"] for label in final_nodes]
-
-        label_to_int = {label: i for i, label in enumerate(final_nodes)}
-
-        final_edges = [(label_to_int[u], label_to_int[v]) for u, v in G_heavy.edges()]
-
-        graph = cls.from_coordinates(final_coords)
-        graph.add_edges_from(final_edges)
-        graph._reset_dicts()
-        return graph
+        return cls._from_template(_heavy_hexagonal_template(m, n), spacing)
 
     @classmethod
     def square(
@@ -216,14 +245,7 @@ class DataGraph(BaseGraph):
             n: Number of columns of square.
             spacing: The distance between adjacent nodes on the final lattice.
         """
-        G = nx.grid_2d_graph(m, n)
-        final_coords = [(x * spacing, y * spacing) for (x, y) in list(G.nodes)]
-        G = nx.convert_node_labels_to_integers(G)
-
-        graph = DataGraph.from_coordinates(final_coords)
-        graph.add_edges_from(G.edges)
-        graph._reset_dicts()
-        return graph
+        return cls._from_template(_square_template(m, n), spacing)
 
     @classmethod
     def random_ud(
@@ -278,15 +300,13 @@ class DataGraph(BaseGraph):
         if np.allclose(diag, np.zeros(n_nodes), rtol=0.0, atol=nonzero_tol):
             node_weights = {i: None for i in range(n_nodes)}
         else:
-            node_weights = {i: diag[i].item() for i in range(n_nodes)}
+            node_weights = dict(enumerate(diag.tolist()))
 
-        edge_list = [
-            (i, j)
-            for i in range(n_nodes)
-            for j in range(i + 1, n_nodes)
-            if (np.abs(data[i, j]) >= nonzero_tol)
-        ]
-        edge_weights = {(i, j): data[i, j].item() for i, j in edge_list}
+        iu, ju = np.triu_indices(n_nodes, k=1)
+        upper = data[iu, ju]
+        mask = np.abs(upper) >= nonzero_tol
+        edge_list = list(zip(iu[mask].tolist(), ju[mask].tolist()))
+        edge_weights = dict(zip(edge_list, upper[mask].tolist()))
 
         graph = cls.from_nodes(range(n_nodes))
         graph.add_edges_from(edge_list)
@@ -633,14 +653,25 @@ class DataGraph(BaseGraph):
                 raise ValueError("Size of the weights list does not match the number of nodes.")
             weights_dict = {i: w for i, w in zip(self.sorted_edges, weights)}
         elif isinstance(weights, dict):
-            edges = set(weights.keys())
-            if set(self.sorted_edges) != edges:
+            if weights.keys() != self.sorted_edges:
                 raise ValueError(
                     "Set of edges in the given dictionary does not match the graph ordered edges."
                 )
             weights_dict = weights
         self._edge_weights = weights_dict
 
+    @property
+    def edge_weights_array(self) -> np.ndarray:
+        """Return the edge weights as a float array of shape (n_edges,).
+
+        Weights follow the order of the edges in `edges_array` and `edge_nodes`.
+        Edges without a weight are set to NaN.
+        """
+        nodes = list(self.nodes)
+        edges = [(nodes[i], nodes[j]) for i, j in self.edges_array.tolist()]
+        weights = [self._edge_weights.get((u, v) if u <= v else (v, u)) for u, v in edges]
+        return np.array([np.nan if w is None else w for w in weights], dtype=float)
+
     def set_ud_edges(self, radius: float) -> None:
         """Reset the set of edges to be equal to the set of unit-disk edges."""
         super().set_ud_edges(radius=radius)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-import random
 from itertools import product
 from math import dist, hypot, isclose
 from typing import Iterable
 
 import numpy as np
+from scipy.spatial.distance import pdist
 
 ATOL_32 = 1e-7
 
@@ -29,6 +29,18 @@ def distances(coords: dict, edge_list: Iterable) -> dict:
     return {edge: dist(coords[edge[0]], coords[edge[1]]) for edge in edge_list}
 
 
+def pairwise_distances(coords: np.ndarray) -> np.ndarray:
+    """Return the condensed array of distances between all pairs of coordinates.
+
+    The distance between rows i < j is stored in the same order as the pairs
+    given by `np.triu_indices(n, k=1)`.
+
+    Arguments:
+        coords: array of node coordinates of shape (n, d).
+    """
+    return pdist(np.asarray(coords, dtype=float))
+
+
 def radial_distances(coords: dict) -> dict:
     """Return a dictionary of node distances from the origin.
 
@@ -56,9 +68,8 @@ def space_coords(coords: dict, spacing: float) -> dict:
         coords: dictionary of node coordinates.
         spacing: value to set as minimum distance.
     """
-    pairs = all_node_pairs(list(coords.keys()))
-    min_dist = min(distances(coords, pairs).values())
-    scale_factor = spacing / min_dist
+    min_dist = pairwise_distances(np.array(list(coords.values()))).min()
+    scale_factor = spacing / min_dist.item()
     return scale_coords(coords, scale_factor)
 
 
@@ -76,8 +87,10 @@ def random_coords(n: int, L: float = 1.0) -> list:
 
 def random_edge_list(nodes: Iterable, k: int) -> list:
     """Generates a random set of k edges linkings items from a set of nodes."""
-    all_edges = all_node_pairs(nodes)
-    return random.sample(tuple(all_edges), k=k)
+    node_list = sorted(set(nodes))
+    iu, ju = np.triu_indices(len(node_list), k=1)
+    sel = np.random.choice(len(iu), size=k, replace=False)
+    return [(node_list[i], node_list[j]) for i, j in zip(iu[sel].tolist(), ju[sel].tolist())]
 
 
 def less_or_equal(a: float, b: float, rel_tol: float = 0.0, abs_tol: float = ATOL_32) -> bool:
@@ -175,7 +175,7 @@ class QuantumProgram:
                 )
 
                 if return_fig:
-                    plt.close()
+                    plt.close(fig)
                     return fig
                 else:
                     return None
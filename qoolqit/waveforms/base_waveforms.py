@@ -98,9 +98,23 @@ class Waveform(ABC):
         """Dictionary of parameters used by the waveform."""
         return self._params_dict
 
+    def _function_array(self, t: np.ndarray) -> np.ndarray:
+        """Evaluates the waveform function on an array of times within [0, duration].
+
+        Defaults to calling `function` element-wise. Subclasses whose `function` is
+        expressible with NumPy operations override this to evaluate all times at once.
+        """
+        return np.vectorize(self.function, otypes=[float])(t)
+
     def _single_call(self, t: float) -> float:
         return 0.0 if (t < 0.0 or t > self.duration) else self.function(t)
 
+    def _array_call(self, t: np.ndarray) -> np.ndarray:
+        values = np.zeros(t.shape)
+        mask = (t >= 0.0) & (t <= self.duration)
+        values[mask] = self._function_array(t[mask])
+        return values
+
     @overload
     def __call__(self, t: float) -> float: ...
 
@@ -109,9 +123,10 @@ class Waveform(ABC):
 
     def __call__(self, t: float | list[float] | np.ndarray) -> float | list[float] | np.ndarray:
         if isinstance(t, np.ndarray):
-            return np.vectorize(self._single_call)(t)
+            return self._array_call(t)
         if isinstance(t, list):
-            return [self._single_call(ti) for ti in t]
+            values: list[float] = self._array_call(np.asarray(t, dtype=float)).tolist()
+            return values
         return self._single_call(t)
 
     def __rshift__(self, other: Waveform) -> CompositeWaveform:
@@ -147,7 +162,7 @@ class Waveform(ABC):
         ax.set_xlabel("Time t")
         ax.set_ylabel("Waveform")
         if return_fig:
-            plt.close()
+            plt.close(fig)
             return fig
         else:
             return None
@@ -187,18 +202,22 @@ class CompositeWaveform(Waveform):
             else:
                 self._waveforms.append(wf)
 
-        super().__init__(sum(self.durations))
+        self._durations = np.array([wf.duration for wf in self._waveforms], dtype=float)
+        self._times = np.concatenate(([0.0], np.cumsum(self._durations)))
+
+        super().__init__(float(self._times[-1]))
 
     @property
     def durations(self) -> list[float]:
         """Returns the list of durations of each individual waveform."""
-        return [wf.duration for wf in self._waveforms]
+        durations: list[float] = self._durations.tolist()
+        return durations
 
     @property
     def times(self) -> list[float]:
         """Returns the list of times when each individual waveform starts."""
-        time_array: list[float] = np.cumsum([0.0] + self.durations).tolist()
-        return time_array
+        times: list[float] = self._times.tolist()
+        return times
 
     @property
     def waveforms(self) -> list[Waveform]:
@@ -208,17 +227,27 @@ class CompositeWaveform(Waveform):
     @property
     def n_waveforms(self) -> int:
         """Returns the number of waveforms."""
-        return len(self.waveforms)
+        return len(self._waveforms)
 
     def function(self, t: float) -> float:
-        idx = np.searchsorted(self.times, t, side="right") - 1
+        idx = np.searchsorted(self._times, t, side="right") - 1
         # clip to valid waveform index range
         idx = np.clip(idx, 0, self.n_waveforms - 1)
 
-        local_t = t - self.times[idx]
-        value: float = self.waveforms[idx](local_t)
+        local_t = t - self._times[idx]
+        value: float = self._waveforms[idx](local_t)
         return value
 
+    def _function_array(self, t: np.ndarray) -> np.ndarray:
+        idx = np.searchsorted(self._times, t, side="right") - 1
+        idx = np.clip(idx, 0, self.n_waveforms - 1)
+
+        values = np.empty(t.shape)
+        for i, wf in enumerate(self._waveforms):
+            mask = idx == i
+            values[mask] = wf(t[mask] - self._times[i])
+        return values
+
     def max(self) -> float:
         """Get the maximum value of the waveform."""
         return max([wf.max() for wf in self.waveforms])
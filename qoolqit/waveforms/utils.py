@@ -14,15 +14,16 @@ def round_to_sum(values: list[float]) -> list[int]:
         >>> [100, 100, 101]
         ```
     """
-    rounded_values = [round(el) for el in values]
-    remainders = [el - rel for rel, el in zip(rounded_values, values)]
-    sum_remainders = round(sum(remainders))
+    array = np.asarray(values, dtype=float)
+    rounded_values = np.round(array)
+    remainders = array - rounded_values
+    sum_remainders = round(float(remainders.sum()))
     p = np.argsort(remainders)
 
-    for i in range(abs(sum_remainders)):
-        if sum_remainders < 0:
-            rounded_values[p[i]] -= 1
-        if sum_remainders > 0:
-            rounded_values[p[-1 - i]] += 1
+    if sum_remainders < 0:
+        rounded_values[p[:-sum_remainders]] -= 1
+    elif sum_remainders > 0:
+        rounded_values[p[-sum_remainders:]] += 1
 
-    return rounded_values
+    result: list[int] = rounded_values.astype(int).tolist()
+    return result
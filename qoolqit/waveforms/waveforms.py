@@ -19,6 +19,12 @@ class DelayWaveform(Waveform):
     def function(self, t: float) -> float:
         return 0.0
 
+    def _single_call(self, t: float) -> float:
+        return 0.0
+
+    def _array_call(self, t: np.ndarray) -> np.ndarray:
+        return np.zeros(t.shape)
+
     def max(self) -> float:
         return 0.0
 
@@ -56,6 +62,12 @@ class RampWaveform(Waveform):
         fraction = t / self._duration
         return self.initial_value + fraction * (self.final_value - self.initial_value)
 
+    def _function_array(self, t: np.ndarray) -> np.ndarray:
+        values = t / self._duration
+        values *= self.final_value - self.initial_value
+        values += self.initial_value
+        return values
+
     def max(self) -> float:
         return max([self.initial_value, self.final_value])
 
@@ -93,6 +105,9 @@ class ConstantWaveform(Waveform):
     def function(self, t: float) -> float:
         return self.value
 
+    def _array_call(self, t: np.ndarray) -> np.ndarray:
+        return np.where((t >= 0.0) & (t <= self.duration), float(self.value), 0.0)
+
     def max(self) -> float:
         return self.value
 
@@ -136,9 +151,20 @@ class BlackmanWaveform(Waveform):
     def function(self, t: float) -> float:
         alpha = 2 * math.pi / self.duration
         A = self.area / (0.42 * self.duration)
-        value = A * (0.42 - 0.5 * math.cos(alpha * t) + 0.08 * math.cos(2 * alpha * t))
+        # cos(2x) = 2cos(x)² - 1 turns the window into a quadratic in cos(αt),
+        # factored so that it is exactly zero at both ends
+        cos = math.cos(alpha * t)
+        value = A * (1 - cos) * (0.34 - 0.16 * cos)
         return max(value, 0.0)
 
+    def _function_array(self, t: np.ndarray) -> np.ndarray:
+        alpha = 2 * np.pi / self.duration
+        A = self.area / (0.42 * self.duration)
+        cos = np.cos(alpha * t)
+        values = A * (1 - cos)
+        values *= 0.34 - 0.16 * cos
+        return np.maximum(values, 0.0, out=values)
+
     def max(self) -> float:
         return self.area / (0.42 * self.duration)
 
@@ -159,8 +185,11 @@ class PiecewiseLinearWaveform(CompositeWaveform):
     through the given N+1 values.
 
     Arguments:
-        durations: list or tuple of N duration values.
-        values: list or tuple of N+1 waveform values.
+        durations: list, tuple or array of N duration values.
+        values: list, tuple or array of N+1 waveform values.
+
+    Attributes:
+        values: list of the N+1 waveform values.
     """
 
     def __init__(
@@ -169,25 +198,35 @@ class PiecewiseLinearWaveform(CompositeWaveform):
         values: list[float] | tuple[float, ...] | np.ndarray,
     ) -> None:
 
+        durations = np.array(durations, dtype=float)
+        values = np.array(values, dtype=float)
+
         if len(durations) + 1 != len(values) or len(durations) == 1:
             raise ValueError(
                 "A PiecewiseLinearWaveform requires N durations and N + 1 values, for N >= 2."
             )
 
-        for duration in durations:
-            if duration == 0.0:
-                raise ValueError("A PiecewiseLinearWaveform interval cannot have zero duration.")
+        if np.any(durations == 0.0):
+            raise ValueError("A PiecewiseLinearWaveform interval cannot have zero duration.")
 
-        self.values = values
+        self._values = values
+        self.values: list[float] = values.tolist()
 
-        wfs = [RampWaveform(dur, values[i], values[i + 1]) for i, dur in enumerate(durations)]
+        wfs = [
+            RampWaveform(dur, v0, v1)
+            for dur, v0, v1 in zip(durations.tolist(), self.values[:-1], self.values[1:])
+        ]
 
         super().__init__(*wfs)
 
+    def function(self, t: float) -> float:
+        return float(np.interp(t, self._times, self._values))
+
+    def _function_array(self, t: np.ndarray) -> np.ndarray:
+        return np.interp(t, self._times, self._values)
+
     def __mul__(self, other: float) -> CompositeWaveform:
-        return PiecewiseLinearWaveform(
-            self.durations, values=[value * other for value in self.values]
-        )
+        return PiecewiseLinearWaveform(self._durations, values=self._values * other)
 
     def __repr_header__(self) -> str:
         return "Piecewise linear waveform:\n"
@@ -265,6 +304,10 @@ class InterpolatedWaveform(Waveform):
     def function(self, t: float) -> float:
         return float(self._interp_func(t))
 
+    def _function_array(self, t: np.ndarray) -> np.ndarray:
+        values: np.ndarray = self._interp_func(t)
+        return values
+
     def min(self) -> float:
         return float(self._values.min())
 
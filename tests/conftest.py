@@ -6,13 +6,28 @@ from typing import Callable, Generator
 import numpy as np
 import pytest
 
+from qoolqit.devices import AnalogDevice, Device, DigitalAnalogDevice, MockDevice
 from qoolqit.drive import DetuningMapModulator, Drive
 from qoolqit.program import QuantumProgram
 from qoolqit.register import Register
 from qoolqit.waveforms import RampWaveform, Waveform
 
+QOOLQIT_DEFAULT_DEVICES = [AnalogDevice, DigitalAnalogDevice, MockDevice]
 
-@pytest.fixture
+
+@pytest.fixture(scope="session", params=QOOLQIT_DEFAULT_DEVICES, ids=lambda d: d.__name__)
+def device(request: pytest.FixtureRequest) -> Device:
+    """Device instance built once per device class for the whole test session.
+
+    Runs over all the default QoolQit devices, unless parametrized indirectly with
+    other device classes, e.g.
+    `@pytest.mark.parametrize("device", [AnalogDevice, MockDevice], indirect=True)`.
+    """
+    device_class: Callable[[], Device] = request.param
+    return device_class()
+
+
+@pytest.fixture(scope="module")
 def random_linear_register_factory() -> Callable[[float, int | np.random.Generator], Register]:
     def _generate_random_linear_register(
         min_distance: float, seed: int | np.random.Generator = np.random.default_rng()
@@ -26,7 +41,7 @@ def random_linear_register_factory() -> Callable[[float, int | np.random.Generat
     return _generate_random_linear_register
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def random_waveform_factory() -> (
     Callable[[float, float, float, int | np.random.Generator], Waveform]
 ):
@@ -56,7 +71,7 @@ def random_waveform_factory() -> (
     return _create_random_waveform
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dmm_program(
     random_linear_register_factory: Callable[[float, int | np.random.Generator], Register],
 ) -> Generator[Callable[[], QuantumProgram]]:
@@ -13,9 +13,7 @@ from pulser.sequence import Sequence as PulserSequence
 from qoolqit import (
     AnalogDevice,
     Device,
-    DigitalAnalogDevice,
     Drive,
-    MockDevice,
     QuantumProgram,
     Register,
 )
@@ -27,7 +25,7 @@ from qoolqit.waveforms import ConstantWaveform, InterpolatedWaveform
 class TestMaxEnergyCompilerProfile:
     profile = CompilerProfile.MAX_ENERGY
 
-    @pytest.fixture(autouse=True)
+    @pytest.fixture
     def program_factory(
         self,
         random_waveform_factory: Callable,
@@ -55,7 +53,6 @@ class TestMaxEnergyCompilerProfile:
 
         return _generate_program
 
-    @pytest.mark.parametrize("device", [AnalogDevice(), DigitalAnalogDevice(), MockDevice()])
     def test_program_compilation(self, program_factory: Callable, device: Device) -> None:
 
         program = program_factory(device)
@@ -127,7 +124,6 @@ class TestMaxEnergyCompilerProfile:
             with pytest.raises(CompilationError, match=msg):
                 program.compile_to(AnalogDevice(), profile=self.profile)
 
-    @pytest.mark.parametrize("device", [AnalogDevice(), DigitalAnalogDevice(), MockDevice()])
     @pytest.mark.parametrize(
         "values",
         [
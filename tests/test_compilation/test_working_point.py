@@ -11,9 +11,7 @@ from pulser.sequence import Sequence as PulserSequence
 from qoolqit import (
     AnalogDevice,
     Device,
-    DigitalAnalogDevice,
     Drive,
-    MockDevice,
     QuantumProgram,
     Register,
 )
@@ -25,7 +23,7 @@ from qoolqit.waveforms import ConstantWaveform
 class TestWorkingPointCompilerProfile:
     profile = CompilerProfile.WORKING_POINT
 
-    @pytest.fixture(autouse=True)
+    @pytest.fixture
     def program_factory(
         self,
         random_waveform_factory: Callable,
@@ -51,7 +49,6 @@ class TestWorkingPointCompilerProfile:
 
         return _generate_program
 
-    @pytest.mark.parametrize("device", [AnalogDevice(), DigitalAnalogDevice(), MockDevice()])
     def test_program_init_and_compilation(self, program_factory: Callable, device: Device) -> None:
 
         program = program_factory(device)
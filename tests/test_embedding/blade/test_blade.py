@@ -505,7 +505,8 @@ def test_simple_positions() -> None:
 
 @pytest.mark.parametrize(
     "device, expected_max_min_ratio",
-    [(AnalogDevice(), 7.6), (DigitalAnalogDevice(), 12.5), (MockDevice(), None)],
+    [(AnalogDevice, 7.6), (DigitalAnalogDevice, 12.5), (MockDevice, None)],
+    indirect=["device"],
 )
 def test_config_from_device(device: Device, expected_max_min_ratio: float | None) -> None:
     config = BladeConfig(device=device)
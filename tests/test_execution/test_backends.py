@@ -19,16 +19,13 @@ from qoolqit.program import QuantumProgram
 class TestBackends:
 
     mock_connection = MagicMock(spec=RemoteConnection)
-    mock_config = MagicMock(spec=EmulationConfig)
     mock_sequence = MagicMock(spec=PulserSequence)
     mock_program_compiled = MagicMock(spec=QuantumProgram, _compiled_sequence=mock_sequence)
-    mock_program_not_compiled = MagicMock(
-        spec=QuantumProgram, _compiled_sequence=None, is_compiled=False
-    )
 
     class MockEmulatorBackend(EmulatorBackend):
         run_calls = 0
         default_config = MagicMock(spec=EmulationConfig, _backend_options={})
+        mock_results = MagicMock(spec=Results)
 
         @staticmethod
         def validate_sequence(sequence: PulserSequence, mimic_qpu: bool = False) -> None:
@@ -36,11 +33,13 @@ class TestBackends:
 
         def run(self) -> Results | Sequence[Results]:
             self.run_calls += 1
-            return MagicMock(spec=Results)
+            return self.mock_results
 
     class MockRemoteEmulatorBackend(RemoteEmulatorBackend):
         run_calls = 0
         default_config = MagicMock(spec=EmulationConfig, _backend_options={})
+        mock_results = MagicMock(spec=RemoteResults, _connection=MagicMock(spec=RemoteConnection))
+        type(mock_results).job_ids = PropertyMock(return_value=["job_id1"])
 
         @staticmethod
         def validate_sequence(sequence: PulserSequence, mimic_qpu: bool = False) -> None:
@@ -50,9 +49,7 @@ class TestBackends:
             self, job_params: list[JobParams] | None = None, wait: bool = False
         ) -> RemoteResults:
             self.run_calls += 1
-            mock = MagicMock(spec=RemoteResults, _connection=MagicMock(spec=RemoteConnection))
-            type(mock).job_ids = PropertyMock(return_value=["job_id1"])
-            return mock
+            return self.mock_results
 
     def test_default_backend(self) -> None:
         backend = LocalEmulator(backend_type=self.MockEmulatorBackend)
@@ -71,10 +68,8 @@ class TestBackends:
         config = EmulationConfig(observables=(BitStrings(num_shots=1117),))
         backend = LocalEmulator(backend_type=self.MockEmulatorBackend, emulation_config=config)
 
-        # convert configs to str
-        expected_config_repr = config.to_abstract_repr()
-        config_repr = backend._emulation_config.to_abstract_repr()
-        assert config_repr == expected_config_repr
+        # a config that already samples bitstrings is kept as is
+        assert backend._emulation_config is config
 
     def test_emulator_backend_with_no_num_shots(self) -> None:
         backend = LocalEmulator(backend_type=self.MockEmulatorBackend, num_shots=123)
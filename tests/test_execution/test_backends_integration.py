@@ -10,21 +10,34 @@ from qoolqit.execution import BackendType, EmulationConfig, JobStatus, LocalEmul
 from qoolqit.waveforms import ConstantWaveform
 
 
-@pytest.mark.parametrize("rotation_angle", [0.3 * np.pi])
-@pytest.mark.parametrize("backend_type", [BackendType.QutipBackendV2, BackendType.SVBackend])
-def test_theoretical_state_vector(backend_type: Backend, rotation_angle: float) -> None:
+@pytest.fixture(scope="module", params=[0.3 * np.pi])
+def rotation_angle(request: pytest.FixtureRequest) -> float:
+    return float(request.param)
 
-    # Theoretical excited population after X rotation
-    # exp(-iθσₓ/2)|g❭ = [cos(θ/2)I - i*sin(θ/2)σₓ]|g❭
-    expected_r_pop = np.sin(rotation_angle / 2) ** 2
 
-    # Create and run a quantum program with different backends
+@pytest.fixture(scope="module")
+def rotation_program(rotation_angle: float) -> QuantumProgram:
+    """Program rotating two non-interacting qubits, compiled once for all backends."""
     duration = 5
     drive = Drive(amplitude=ConstantWaveform(duration, rotation_angle / duration), phase=0)
     # atoms far away, no interaction
     register = Register.from_coordinates([(-10, -10), (10, 10)])
     program = QuantumProgram(register, drive)
     program.compile_to(device=MockDevice())
+    return program
+
+
+@pytest.mark.parametrize("backend_type", [BackendType.QutipBackendV2, BackendType.SVBackend])
+def test_theoretical_state_vector(
+    backend_type: Backend, rotation_angle: float, rotation_program: QuantumProgram
+) -> None:
+
+    # Theoretical excited population after X rotation
+    # exp(-iθσₓ/2)|g❭ = [cos(θ/2)I - i*sin(θ/2)σₓ]|g❭
+    expected_r_pop = np.sin(rotation_angle / 2) ** 2
+
+    # Run the same compiled quantum program with different backends
+    program = rotation_program
     emulation_config = EmulationConfig(observables=(Occupation(),))
     emulator = LocalEmulator(backend_type=backend_type, emulation_config=emulation_config)
     job = emulator.run(program)
@@ -39,9 +52,10 @@ def test_theoretical_state_vector(backend_type: Backend, rotation_angle: float)
 @pytest.mark.parametrize(
     "backend_type, device",
     [
-        (BackendType.SVBackend, MockDevice()),
-        (BackendType.SVBackend, AnalogDevice()),
+        (BackendType.SVBackend, MockDevice),
+        (BackendType.SVBackend, AnalogDevice),
     ],
+    indirect=["device"],
 )
 def test_results(backend_type: Backend, device: Device) -> None:
     # Just run once and test multiple things for efficiency
@@ -7,7 +7,9 @@ import numpy as np
 import pytest
 from torch_geometric.data import Data
 
-from qoolqit.graphs import BaseGraph, random_coords, random_edge_list
+from qoolqit.graphs import BaseGraph, distances, random_coords, random_edge_list
+
+rng = np.random.default_rng(0)
 
 
 @pytest.mark.parametrize("n_nodes", [5, 10, 50])
@@ -52,7 +54,7 @@ def test_basegraph_init(n_nodes: int) -> None:
     scale = ((actual_n_nodes**0.5) ** 0.5) / 2
     coords = random_coords(actual_n_nodes, scale)
 
-    graph.coords = {i: pos for i, pos in zip(graph.nodes, coords)}
+    graph.coords = coords
 
     assert graph.has_coords
     assert graph.max_distance() <= 2 * scale
@@ -108,8 +110,7 @@ def test_basegraph_constructors(n_nodes: int) -> None:
 
     # Since we used the UD radius value, all edges in the UD set are
     # now expected to have exactly this minimum distance
-    for edge in graph1.ud_edges(radius):
-        assert np.isclose(graph2.distances()[edge], graph2.min_distance())
+    assert np.allclose(graph2.edge_distances(graph1.ud_edges(radius)), graph2.min_distance())
 
     # Reset our changes, and rescale again
     graph1.rescale_coords(spacing=graph2.min_distance())  # type: ignore [arg-type]
@@ -123,6 +124,79 @@ def test_basegraph_constructors(n_nodes: int) -> None:
     assert graph2.is_ud_graph()
 
 
+@pytest.mark.parametrize("n_nodes", [2, 10, 300])
+def test_basegraph_all_pairs_distances(n_nodes: int) -> None:
+    node_list = rng.choice(np.arange(1, 1000), size=n_nodes, replace=False).tolist()
+    positions = rng.uniform(-0.5, 0.5, size=(n_nodes, 2)).tolist()
+    coords = {i: tuple(pos) for i, pos in zip(node_list, positions)}
+    graph = BaseGraph.from_coordinates(coords)
+
+    expected = distances(coords, graph.all_node_pairs)
+    result = graph.distances()
+
+    assert result.keys() == expected.keys()
+    pairs = list(expected)
+    np.testing.assert_allclose([result[p] for p in pairs], [expected[p] for p in pairs])
+
+
+def test_basegraph_empty_distances() -> None:
+    match = "Trying to compute distances for an empty edge list."
+
+    # a single node has no node pairs at all
+    graph = BaseGraph.from_coordinates({0: (0.0, 0.0)})
+    for connected in [True, False, None]:
+        with pytest.raises(ValueError, match=match):
+            graph.min_distance(connected)
+        with pytest.raises(ValueError, match=match):
+            graph.max_distance(connected)
+    with pytest.raises(ValueError, match=match):
+        graph.ud_radius_range()
+
+    # an edgeless graph has no connected node pairs
+    graph = BaseGraph.from_coordinates({0: (0.0, 0.0), 1: (1.0, 0.0), 2: (0.0, 1.0)})
+    with pytest.raises(ValueError, match=match):
+        graph.min_distance(connected=True)
+    with pytest.raises(ValueError, match=match):
+        graph.max_distance(connected=True)
+
+    # a complete graph has no disconnected node pairs
+    graph.add_edges_from([(0, 1), (0, 2), (1, 2)])
+    with pytest.raises(ValueError, match=match):
+        graph.min_distance(connected=False)
+    with pytest.raises(ValueError, match=match):
+        graph.max_distance(connected=False)
+
+
+def test_basegraph_arrays() -> None:
+    coords = {3: (0.0, 0.0), 1: (1.0, 0.0), 7: (0.0, 2.0)}
+    graph = BaseGraph.from_coordinates(coords)
+    graph.add_edges_from([(7, 3), (3, 1)])
+
+    node_ids, coords_array = graph.coords_array
+    np.testing.assert_array_equal(node_ids, [3, 1, 7])
+    np.testing.assert_array_equal(coords_array, [(0.0, 0.0), (1.0, 0.0), (0.0, 2.0)])
+
+    np.testing.assert_array_equal(graph.edges_array, [(0, 1), (0, 2)])
+    np.testing.assert_array_equal(graph.edge_nodes, [(3, 1), (3, 7)])
+
+    np.testing.assert_allclose(graph.edge_distances(), [1.0, 2.0])
+    np.testing.assert_allclose(graph.edge_distances([(1, 7)]), [np.sqrt(5.0)])
+
+    # tuple labels, e.g. from lattices, are kept as single entries
+    graph = BaseGraph.from_coordinates({(0, 0): (0.0, 0.0), (0, 1): (0.0, 1.0), (1, 0): (1.0, 0.0)})
+    graph.add_edges_from([((0, 0), (0, 1)), ((0, 0), (1, 0))])
+    node_ids, _ = graph.coords_array
+    assert node_ids.shape == (3,)
+    assert node_ids.tolist() == [(0, 0), (0, 1), (1, 0)]
+    assert graph.edge_nodes.shape == (2, 2)
+    assert graph.edge_nodes.tolist() == [[(0, 0), (0, 1)], [(0, 0), (1, 0)]]
+
+    graph = BaseGraph.from_nodes([0, 1])
+    assert graph.edges_array.shape == (0, 2)
+    with pytest.raises(AttributeError):
+        graph.coords_array
+
+
 @pytest.mark.parametrize("input", ["hello", Data()])
 def test_from_nx_wrong_input(input: Any) -> None:
     with pytest.raises(TypeError, match="Input must be a networkx.Graph instance."):
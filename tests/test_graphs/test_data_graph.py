@@ -10,6 +10,8 @@ from qoolqit.graphs import DataGraph, random_edge_list
 
 ATOL_64 = 1e-14
 
+rng = np.random.default_rng(0)
+
 
 @pytest.mark.parametrize("graph_type", ["circle", "line", "random_ud"])
 @pytest.mark.parametrize("n_nodes", [10, 20, 30, 40, 50])
@@ -17,15 +19,17 @@ def test_datagraph_unit_disk(n_nodes: int, graph_type: str) -> None:
 
     spacing = 1.0
 
+    # Rows (i, i + 1) in the sorted order of `edges_array`
+    line_edges = np.column_stack([np.arange(n_nodes - 1), np.arange(1, n_nodes)])
+
     if graph_type == "circle":
         graph = DataGraph.circle(n_nodes, spacing=spacing)
-        circle_edges = set((i, i + 1) for i in range(n_nodes - 1)).union(set([(0, n_nodes - 1)]))
-        assert graph.sorted_edges == circle_edges
+        circle_edges = np.insert(line_edges, 1, (0, n_nodes - 1), axis=0)
+        np.testing.assert_array_equal(graph.edges_array, circle_edges)
         assert np.isclose(graph.min_distance(), spacing)
     if graph_type == "line":
         graph = DataGraph.line(n_nodes, spacing=spacing)
-        line_edges = set((i, i + 1) for i in range(n_nodes - 1))
-        assert graph.sorted_edges == line_edges
+        np.testing.assert_array_equal(graph.edges_array, line_edges)
         assert np.isclose(graph.min_distance(), spacing)
     if graph_type == "random_ud":
         graph = DataGraph.random_ud(n_nodes)
@@ -46,8 +50,9 @@ def test_datagraph_unit_disk(n_nodes: int, graph_type: str) -> None:
     graph.set_ud_edges(radius=radius)
     assert graph.sorted_edges == original_edges
 
-    graph.node_weights = {i: np.random.rand() for i in graph.nodes}
-    graph.edge_weights = {e: np.random.rand() for e in graph.sorted_edges}
+    edges = graph.sorted_edges
+    graph.node_weights = dict(zip(graph.nodes, rng.random(graph.number_of_nodes()).tolist()))
+    graph.edge_weights = dict(zip(edges, rng.random(len(edges)).tolist()))
 
     assert graph.has_node_weights
     assert graph.has_edge_weights
@@ -110,11 +115,9 @@ def test_datagraph_from_matrix(n_nodes: int) -> None:
     for edge in random_edges_removal:
         assert edge not in graph.sorted_edges
 
-    n_edges = graph.number_of_edges()
-    idx = [2 * i for i in range(n_edges)]
-
-    data_edge_weights = np.sort(data2[data2 >= 1e-7])[idx]
-    edge_weights = sorted(list(graph.edge_weights.values()))
+    upper = data2[np.triu_indices(n_nodes, k=1)]
+    data_edge_weights = np.sort(upper[upper >= 1e-7])
+    edge_weights = np.sort(graph.edge_weights_array)
 
     np.testing.assert_allclose(edge_weights, data_edge_weights)
 
@@ -131,8 +134,9 @@ def test_triangular() -> None:
         5: (2.71, 4.693857688511657),
     }
 
-    for k, v in graph.coords.items():
-        assert np.allclose(v, expected_coords[k])
+    node_ids, coords = graph.coords_array
+    expected_coords_array = np.array([expected_coords[i] for i in node_ids])
+    assert np.allclose(coords, expected_coords_array, atol=ATOL_64)
 
     edges = graph.sorted_edges
     expected_edges = {(0, 1), (0, 2), (1, 3), (1, 2), (2, 3), (2, 4), (2, 5), (3, 5), (4, 5)}
@@ -162,8 +166,9 @@ def test_hexagonal() -> None:
         15: (9.0, 12.990381056766578),
     }
 
-    for k, v in graph.coords.items():
-        assert np.allclose(v, expected_coords[k])
+    node_ids, coords = graph.coords_array
+    expected_coords_array = np.array([expected_coords[i] for i in node_ids])
+    assert np.allclose(coords, expected_coords_array, atol=ATOL_64)
 
     edges = graph.sorted_edges
     expected_edges = {
@@ -212,8 +217,9 @@ def test_square() -> None:
         15: (8.13, 8.13),
     }
 
-    for k, v in graph.coords.items():
-        assert np.allclose(v, expected_coords[k])
+    node_ids, coords = graph.coords_array
+    expected_coords_array = np.array([expected_coords[i] for i in node_ids])
+    assert np.allclose(coords, expected_coords_array)
 
     edges = graph.sorted_edges
 
@@ -286,8 +292,9 @@ def test_heavy_hexagonal() -> None:
         33: (10.400000000000002, 12.470765814495916),
         34: (9.600000000000001, 13.856406460551018),
     }
-    for k, v in graph.coords.items():
-        assert np.allclose(v, expected_coords[k])
+    node_ids, coords = graph.coords_array
+    expected_coords_array = np.array([expected_coords[i] for i in node_ids])
+    assert np.allclose(coords, expected_coords_array)
 
     edges = graph.sorted_edges
     expected_edges = {
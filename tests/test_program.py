@@ -39,7 +39,8 @@ def test_program_init_wrong_type() -> None:
 
 @pytest.mark.parametrize(
     "device",
-    [DigitalAnalogDevice(), MockDevice()],
+    [DigitalAnalogDevice, MockDevice],
+    indirect=True,
 )
 def test_compiler_dmm(
     device: Device,
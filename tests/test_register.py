@@ -1,18 +1,18 @@
 from __future__ import annotations
 
-import random
-
 import numpy as np
 import pytest
 
 from qoolqit.graphs import DataGraph
 from qoolqit.register import Register
 
+rng = np.random.default_rng(0)
+
 
 @pytest.mark.parametrize("n_qubits", [3, 4, 10])
 def test_register_from_coordinates(n_qubits: int) -> None:
 
-    coords = [(random.random(), random.random()) for _ in range(n_qubits)]
+    coords = [tuple(c) for c in rng.random((n_qubits, 2)).tolist()]
     qubits = {i: coords[i] for i in range(n_qubits)}
 
     r1 = Register(qubits)
@@ -33,7 +33,7 @@ def test_register_from_coordinates(n_qubits: int) -> None:
 @pytest.mark.parametrize("n_nodes", [3, 4, 10])
 def test_register_from_graph(n_nodes: int) -> None:
 
-    coords = [(random.random(), random.random()) for _ in range(n_nodes)]
+    coords = [tuple(c) for c in rng.random((n_nodes, 2)).tolist()]
 
     graph = DataGraph.from_coordinates(coords)
 
@@ -89,6 +89,11 @@ class TestWaveform:
         assert wf(-1.0) == 0.0
         assert wf(1.1) == 0.0
 
+        # arrays are masked element-wise
+        t_array = np.array([-1.0, 0.0, 0.5, 1.0, 1.1])
+        np.testing.assert_array_equal(wf(t_array), [0.0, 1.0, 2.0, 3.0, 0.0])
+        assert wf(np.array([])).shape == (0,)
+
     def test_call(self) -> None:
         wf = self.MockWaveform(10.0)
 
@@ -6,7 +6,6 @@ import numpy as np
 import pulser
 import pytest
 from numpy.typing import ArrayLike
-from scipy.integrate import quad
 
 from qoolqit.waveforms import (
     BlackmanWaveform,
@@ -142,7 +141,8 @@ def test_blackman_init() -> None:
     assert wf.params == {"area": area}
 
     # test area as integral
-    res, _ = quad(wf, 0.0, wf.duration)
+    times = np.linspace(0.0, wf.duration, 4096)
+    res = np.trapezoid(wf(times), times)
     assert np.isclose(res, area)
 
 
@@ -185,7 +185,7 @@ def test_blackman_to_pulser() -> None:
 def test_piecewise_init(n_pieces: int) -> None:
 
     durations = [1.0 for _ in range(n_pieces)]
-    values = np.random.rand(n_pieces + 1).tolist()
+    values = np.random.rand(n_pieces + 1)
 
     with pytest.raises(ValueError):
         wf = PiecewiseLinearWaveform([1.0], values)
@@ -214,6 +214,14 @@ def test_piecewise_samples() -> None:
     assert np.all(samples >= wf.min())
     assert np.all(samples <= wf.max())
 
+    # the waveform goes through each value at the start of its segment, and at the end
+    np.testing.assert_allclose(wf(np.array(wf.times)), values)
+
+    # the waveform keeps its own copy of the input values
+    values[1] = 10.0
+    assert wf(1.0) == 5.3
+    assert wf.max() == 5.3
+
 
 def test_piecewise_mul() -> None:
     wf = PiecewiseLinearWaveform([1.0, 2.0, 3.0], values=[-1.3, 1.0, 2.0, 3.0])
@@ -372,6 +380,25 @@ def test_waveform_composition(n_waveforms: int) -> None:
         CompositeWaveform()
 
 
+@pytest.mark.parametrize(
+    "wf",
+    [
+        DelayWaveform(2.0),
+        ConstantWaveform(2.0, value=-0.7),
+        RampWaveform(2.0, initial_value=-1.3, final_value=1.0),
+        BlackmanWaveform(2.0, area=np.pi),
+        InterpolatedWaveform(2.0, values=[0.1, 0.3, -0.5, 1.0], times=[0.0, 0.2, 0.8, 1.0]),
+        PiecewiseLinearWaveform([1.0, 0.5, 0.5], values=[0.0, 2.1, -1.0, 0.3]),
+        ConstantWaveform(0.5, value=1.0) >> BlackmanWaveform(1.0, area=2.0) >> DelayWaveform(0.5),
+    ],
+)
+def test_array_call_matches_scalar_call(wf: Waveform) -> None:
+    times = np.linspace(-0.5, wf.duration + 0.5, 57)
+    samples = wf(times)
+    np.testing.assert_allclose(samples, [wf(t) for t in times.tolist()])
+    assert wf(times.tolist()) == samples.tolist()
+
+
 @pytest.mark.parametrize(
     "values, expected",
     [